@@ -4,6 +4,6 @@ __version__ = "0.1.0"
 
 from .server import main
 from .pdf_navigator import PDFNavigator
-from .config import Config
+from .config import Config, get_config
 
-__all__ = ["main", "PDFNavigator", "Config"]
\ No newline at end of file
+__all__ = ["main", "PDFNavigator", "Config", "get_config"]
\ No newline at end of file
@@ -2,10 +2,16 @@
 
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional
 
 
+def _default_config_path() -> Path:
+    """Get the default config file path, ~/.pdf-navigator-config.json."""
+    return Path.home() / ".pdf-navigator-config.json"
+
+
 class Config:
     """Configuration manager for PDF Navigator MCP."""
     
@@ -14,6 +20,8 @@ class Config:
         "reader_path": None,   # Auto-detect if None
         "search_context_chars": 100,  # Characters around search results
         "max_search_results": 10,     # Max results per search
+        "page_cache_size": 512,       # Pages of extracted text kept in memory
+        "inmem_threshold_bytes": 25_000_000,  # PDFs smaller than this are read into memory
     }
     
     def __init__(self, config_path: Optional[Path] = None):
@@ -22,11 +30,33 @@ class Config:
         Args:
             config_path: Path to config file. Defaults to ~/.pdf-navigator-config.json
         """
-        self.config_path = config_path or Path.home() / ".pdf-navigator-config.json"
-        self.config = self.load_config()
+        self.config_path = config_path or _default_config_path()
+        self._config: Optional[Dict] = None
+    
+    @classmethod
+    def from_dict(cls, values: Dict, config_path: Optional[Path] = None) -> "Config":
+        """Create a configuration from values in memory, without reading a file.
+        
+        Args:
+            values: Configuration values, overriding the defaults
+            config_path: Path that set() saves to. Defaults to ~/.pdf-navigator-config.json
+            
+        Returns:
+            The configuration
+        """
+        config = cls(config_path)
+        config._config = {**cls.DEFAULT_CONFIG, **values}
+        return config
+    
+    @property
+    def config(self) -> Dict:
+        """Get configuration values, loading them from file on first access."""
+        if self._config is None:
+            self._config = self.load_config()
+        return self._config
     
     def load_config(self) -> Dict:
-        """Load configuration from file, create with defaults if missing."""
+        """Load configuration from file, falling back to defaults if missing."""
         if self.config_path.exists():
             try:
                 with open(self.config_path, 'r') as f:
@@ -38,8 +68,7 @@ class Config:
             except (json.JSONDecodeError, IOError):
                 pass
         
-        # Create default config file
-        self.save_config(self.DEFAULT_CONFIG)
+        # Defaults are only written out once a value is set
         return self.DEFAULT_CONFIG.copy()
     
     def save_config(self, config: Dict) -> None:
@@ -77,4 +106,34 @@ class Config:
     @property
     def max_search_results(self) -> int:
         """Get max search results."""
-        return self.get("max_search_results", 10)
\ No newline at end of file
+        return self.get("max_search_results", 10)
+    
+    @property
+    def page_cache_size(self) -> int:
+        """Get number of pages of extracted text to cache."""
+        return self.get("page_cache_size", 512)
+    
+    @property
+    def inmem_threshold_bytes(self) -> int:
+        """Get size below which PDFs are read into memory when opened."""
+        return self.get("inmem_threshold_bytes", 25_000_000)
+
+
+def get_config(config_path: Optional[Path] = None) -> Config:
+    """Get the shared configuration for a config file.
+    
+    Args:
+        config_path: Path to config file. Defaults to ~/.pdf-navigator-config.json
+        
+    Returns:
+        The same Config object for every call with the same path, so the file
+        is read and parsed at most once
+    """
+    # Resolve first, so every spelling of the same file shares one Config
+    return _get_config(Path(config_path or _default_config_path()).resolve())
+
+
+@lru_cache(maxsize=8)
+def _get_config(config_path: Path) -> Config:
+    """Get the shared configuration for a resolved config file path."""
+    return Config(config_path)
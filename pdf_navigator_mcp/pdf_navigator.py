@@ -1,11 +1,77 @@
 """Core PDF navigation functionality."""
 
+import os
 import platform
+import re
 import subprocess
-from pathlib import Path
-from typing import Optional
-import fitz  # PyMuPDF
-from .config import Config
+import threading
+import time
+from collections import OrderedDict
+from itertools import islice
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+from .config import Config, get_config
+
+if TYPE_CHECKING:
+    import fitz  # PyMuPDF
+
+# Number of open PDFs kept in memory
+DOCUMENT_CACHE_SIZE = 8
+
+# Number of recent searches whose results are kept for reuse
+SEARCH_CACHE_SIZE = 16
+
+# Seconds a file's stat result is reused before the file is checked again
+STAT_CACHE_TTL = 1.0
+
+# Runs of whitespace collapsed to a single space in search context
+_WS_RE = re.compile(r'\s+')
+
+# A non-empty line of page text, from its first non-whitespace character
+_LINE_RE = re.compile(r'\S[^\n]*')
+
+
+def _open_pdf(pdf_path: str, in_memory: bool = False) -> "fitz.Document":
+    """Open a PDF with PyMuPDF, importing it on first use.
+    
+    PyMuPDF loads a large C extension, so deferring the import keeps server
+    startup cheap until a tool actually needs to read a PDF.
+    
+    With in_memory, the file is read in one go and parsed from memory. That
+    replaces MuPDF's many small reads of the file, and leaves the document
+    intact if the file is rewritten while the document is still open.
+    """
+    import fitz  # PyMuPDF
+    
+    if in_memory:
+        with open(pdf_path, 'rb') as f:
+            # The document keeps a reference to the bytes it reads from
+            return fitz.open(stream=f.read(), filetype="pdf")
+    return fitz.open(pdf_path)
+
+
+def _find_all(text: str, sub: str) -> Iterator[int]:
+    """Yield the start offsets of non-overlapping occurrences of sub in text."""
+    pos = text.find(sub)
+    while pos != -1:
+        yield pos
+        pos = text.find(sub, pos + len(sub))
+
+
+class PDFPathError(ValueError):
+    """Raised when a tool is given a path that is missing or not a PDF."""
+
+
+class _CachedDocument:
+    """An open PDF, the cache key identifying its contents, and details of
+    the document worked out on first request (None until then).
+    """
+    
+    def __init__(self, doc: "fitz.Document", key: Tuple[str, int, int]):
+        self.doc = doc
+        self.key = key
+        self.toc: Optional[List[list]] = None
+        self.page_summaries: Optional[List[str]] = None
+        self.info: Optional[str] = None
 
 
 class PDFNavigator:
@@ -15,9 +81,26 @@ class PDFNavigator:
         """Initialize PDF navigator.
         
         Args:
-            config: Configuration object. Creates default if None.
+            config: Configuration object. Uses the shared default from get_config() if None.
         """
-        self.config = config or Config()
+        self.config = config or get_config()
+        self._doc_cache: OrderedDict[Tuple[str, int, int], _CachedDocument] = OrderedDict()
+        
+        # Recent stat results: path -> (time checked, resolved path, stat)
+        self._stat_cache: Dict[str, Tuple[float, str, os.stat_result]] = {}
+        
+        # Extracted text of recently used pages, keyed by (document key, page
+        # index), with the lowercased copy used for searching once computed.
+        # Kept apart from the documents so text outlives a closed document.
+        self._page_text: OrderedDict[Tuple[Tuple[str, int, int], int], Tuple[str, Optional[str]]] = OrderedDict()
+        
+        # Results of recent searches, so search_and_open can pick a result
+        # from a search that was just shown without running it again
+        self._search_results: OrderedDict[tuple, List[Dict]] = OrderedDict()
+        
+        # Tools may run concurrently, but MuPDF documents are not thread-safe;
+        # hold this while using a cached document or changing the cache
+        self._lock = threading.RLock()
     
     def open_pdf_page(self, file_path: str, page_number: int) -> str:
         """Open PDF to specific page using configured reader.
@@ -29,24 +112,32 @@ class PDFNavigator:
         Returns:
             Status message
         """
-        pdf_path = Path(file_path)
-        if not pdf_path.exists():
-            return f"Error: PDF file not found: {file_path}"
-        
-        if not pdf_path.suffix.lower() == '.pdf':
-            return f"Error: File is not a PDF: {file_path}"
+        try:
+            pdf_path = self._validated_path(file_path, require_pdf=True)
+        except PDFPathError as e:
+            return f"Error: {e}"
         
         # Validate page number
         try:
-            doc = fitz.open(str(pdf_path))
-            if page_number < 1 or page_number > len(doc):
-                doc.close()
-                return f"Error: Page {page_number} out of range (1-{len(doc)})"
-            doc.close()
+            page_count = self._get_page_count(pdf_path)
         except Exception as e:
             return f"Error reading PDF: {str(e)}"
         
-        # Open with configured reader
+        if page_number < 1 or page_number > page_count:
+            return f"Error: Page {page_number} out of range (1-{page_count})"
+        
+        return self._launch_reader(pdf_path, page_number)
+    
+    def _launch_reader(self, pdf_path: str, page_number: int) -> str:
+        """Open an existing PDF at a known-valid page with the configured reader.
+        
+        Args:
+            pdf_path: Path to PDF file
+            page_number: Page number (1-indexed), already checked against the page count
+            
+        Returns:
+            Status message
+        """
         reader = self.config.pdf_reader.lower()
         try:
             if reader == "skim":
@@ -62,7 +153,7 @@ class PDFNavigator:
             else:
                 return f"Error: Unsupported PDF reader: {reader}"
             
-            return f"Opened {pdf_path.name} to page {page_number}"
+            return f"Opened {os.path.basename(pdf_path)} to page {page_number}"
         except Exception as e:
             return f"Error opening PDF: {str(e)}"
     
@@ -76,64 +167,107 @@ class PDFNavigator:
         Returns:
             Search results with page numbers and context
         """
-        pdf_path = Path(file_path)
-        if not pdf_path.exists():
-            return f"Error: PDF file not found: {file_path}"
+        try:
+            pdf_path = self._validated_path(file_path)
+        except PDFPathError as e:
+            return f"Error: {e}"
         
         try:
-            doc = fitz.open(str(pdf_path))
-            results = []
-            context_chars = self.config.search_context_chars
-            
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                text = page.get_text()
-                
-                # Find all occurrences of query (case-insensitive)
-                query_lower = query.lower()
-                text_lower = text.lower()
-                
-                start = 0
-                while True:
-                    pos = text_lower.find(query_lower, start)
-                    if pos == -1:
-                        break
-                    
-                    # Extract context around match
-                    context_start = max(0, pos - context_chars // 2)
-                    context_end = min(len(text), pos + len(query) + context_chars // 2)
-                    context = text[context_start:context_end].strip()
-                    
-                    # Clean up context (remove excessive whitespace)
-                    context = ' '.join(context.split())
-                    
-                    results.append({
-                        'page': page_num + 1,  # 1-indexed
-                        'context': context,
-                        'position': pos
-                    })
-                    
-                    start = pos + 1
-                    
-                    # Limit results per page
-                    if len([r for r in results if r['page'] == page_num + 1]) >= 3:
-                        break
-                
-                # Stop if we have enough results
-                if len(results) >= self.config.max_search_results:
-                    break
-            
-            doc.close()
+            results = self._search_pdf_structured(pdf_path, query)
             
             if not results:
-                return f"No results found for '{query}' in {pdf_path.name}"
+                return f"No results found for '{query}' in {os.path.basename(pdf_path)}"
             
             # Format results
-            result_lines = [f"Found {len(results)} results for '{query}' in {pdf_path.name}:\\n"]
+            result_lines = [f"Found {len(results)} results for '{query}' in {os.path.basename(pdf_path)}:\n"]
             for i, result in enumerate(results, 1):
                 result_lines.append(f"{i}. Page {result['page']}: ...{result['context']}...")
             
-            return "\\n".join(result_lines)
+            return "\n".join(result_lines)
+            
+        except Exception as e:
+            return f"Error searching PDF: {str(e)}"
+    
+    def search_and_open(self, file_path: str, query: str, result_index: int = 1) -> str:
+        """Search for text in PDF and open to the specified result.
+        
+        Args:
+            file_path: Path to PDF file
+            query: Search query
+            result_index: Which search result to open (1-indexed)
+            
+        Returns:
+            Status message
+        """
+        try:
+            pdf_path = self._validated_path(file_path, require_pdf=True)
+        except PDFPathError as e:
+            return f"Error: {e}"
+        
+        try:
+            results = self._search_pdf_structured(pdf_path, query)
+        except Exception as e:
+            return f"Error searching PDF: {str(e)}"
+        
+        if not results:
+            return f"No results found for '{query}' in {os.path.basename(pdf_path)}"
+        
+        if result_index < 1 or result_index > len(results):
+            return f"Result {result_index} not found. Check search results first."
+        
+        # Result pages come from the document itself, so skip open_pdf_page's
+        # checks and go straight to the reader
+        open_result = self._launch_reader(pdf_path, results[result_index - 1]['page'])
+        return f"Search result {result_index}: {open_result}"
+    
+    def search_many(self, file_path: str, queries: List[str]) -> str:
+        """Search for several queries in PDF, sharing extracted page text between them.
+        
+        Args:
+            file_path: Path to PDF file
+            queries: Search queries
+            
+        Returns:
+            Search results grouped by query, with page numbers and context
+        """
+        try:
+            pdf_path = self._validated_path(file_path)
+        except PDFPathError as e:
+            return f"Error: {e}"
+        
+        # Search is case-insensitive, so queries differing only in case are
+        # the same search; keep the first spelling of each
+        unique = {}
+        for query in queries:
+            if query:
+                unique.setdefault(query.lower(), query)
+        queries = list(unique.values())
+        if not queries:
+            return "Error: No search queries given"
+        
+        try:
+            # Each query is searched on its own, so a query found inside
+            # another (e.g. 'learning' in 'machine learning') still matches.
+            # Each page is extracted at most once, shared through the page text
+            # cache, and repeated queries through the search result cache.
+            results = {query: self._search_pdf_structured(pdf_path, query) for query in queries}
+            
+            total = sum(len(hits) for hits in results.values())
+            if not total:
+                return f"No results found for {len(queries)} queries in {os.path.basename(pdf_path)}"
+            
+            # Format results, keeping the caller's query order
+            result_lines = [f"Found {total} results for {len(queries)} queries in {os.path.basename(pdf_path)}:"]
+            for query in queries:
+                hits = results[query]
+                if not hits:
+                    result_lines.append(f"\n'{query}': no results")
+                    continue
+                result_lines.append(f"\n'{query}' ({len(hits)} results):")
+                for i, result in enumerate(hits, 1):
+                    result_lines.append(f"{i}. Page {result['page']}: ...{result['context']}...")
+            
+            return "\n".join(result_lines)
             
         except Exception as e:
             return f"Error searching PDF: {str(e)}"
@@ -149,43 +283,41 @@ class PDFNavigator:
         Returns:
             Extracted text content
         """
-        pdf_path = Path(file_path)
-        if not pdf_path.exists():
-            return f"Error: PDF file not found: {file_path}"
+        try:
+            pdf_path = self._validated_path(file_path)
+        except PDFPathError as e:
+            return f"Error: {e}"
         
         try:
-            doc = fitz.open(str(pdf_path))
-            total_pages = len(doc)
+            total_pages = self._get_page_count(pdf_path)
             
             # Validate page range
             if start_page < 1 or start_page > total_pages:
-                doc.close()
                 return f"Error: Start page {start_page} out of range (1-{total_pages})"
             
             if end_page is None:
                 end_page = total_pages
             elif end_page < 1 or end_page > total_pages:
-                doc.close()
                 return f"Error: End page {end_page} out of range (1-{total_pages})"
             
             if start_page > end_page:
-                doc.close()
                 return f"Error: Start page {start_page} cannot be greater than end page {end_page}"
             
             # Extract text from specified pages
+            page_texts = self._get_pages_text(pdf_path, start_page - 1, end_page)
             text_parts = []
-            for page_num in range(start_page - 1, end_page):  # Convert to 0-indexed
-                page = doc[page_num]
-                page_text = page.get_text()
-                if page_text.strip():  # Only add non-empty pages
-                    text_parts.append(f"--- Page {page_num + 1} ---\\n{page_text}")
-            
-            doc.close()
+            for page_num, page_text in enumerate(page_texts, start_page):
+                # Only add non-empty pages; isspace() checks without copying
+                if page_text and not page_text.isspace():
+                    separator = "\n\n" if text_parts else ""
+                    text_parts.append(f"{separator}--- Page {page_num} ---\n")
+                    text_parts.append(page_text)
             
             if not text_parts:
-                return f"No text found in pages {start_page}-{end_page} of {pdf_path.name}"
+                return f"No text found in pages {start_page}-{end_page} of {os.path.basename(pdf_path)}"
             
-            return "\\n\\n".join(text_parts)
+            # Pages go into the output as-is, copied once by the final join
+            return "".join(text_parts)
             
         except Exception as e:
             return f"Error reading PDF: {str(e)}"
@@ -211,47 +343,49 @@ class PDFNavigator:
         Returns:
             PDF structure information
         """
-        pdf_path = Path(file_path)
-        if not pdf_path.exists():
-            return f"Error: PDF file not found: {file_path}"
+        try:
+            pdf_path = self._validated_path(file_path)
+        except PDFPathError as e:
+            return f"Error: {e}"
         
         try:
-            doc = fitz.open(str(pdf_path))
-            
-            # Get table of contents
-            toc = doc.get_toc()
-            
-            # Get page summaries (first few lines of each page)
-            page_summaries = []
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                text = page.get_text()
+            with self._lock:
+                cached = self._get_cached_document(pdf_path)
                 
-                # Get first few lines as summary
-                lines = text.split('\\n')
-                non_empty_lines = [line.strip() for line in lines if line.strip()]
-                summary = ' '.join(non_empty_lines[:3])  # First 3 non-empty lines
+                # Get table of contents
+                if cached.toc is None:
+                    cached.toc = cached.doc.get_toc()
                 
-                if summary:
-                    page_summaries.append(f"Page {page_num + 1}: {summary[:100]}...")
-            
-            doc.close()
+                # Get page summaries (first few lines of each page)
+                if cached.page_summaries is None:
+                    page_summaries = []
+                    for page_num, text in enumerate(self._get_pages_text(pdf_path)):
+                        # Get first 3 non-empty lines as summary, scanning no further
+                        lines = (match.group().strip() for match in _LINE_RE.finditer(text))
+                        summary = ' '.join(islice(lines, 3))
+                        
+                        if summary:
+                            page_summaries.append(f"Page {page_num + 1}: {summary[:100]}...")
+                    cached.page_summaries = page_summaries
+                
+                toc, page_summaries = cached.toc, cached.page_summaries
+                page_count = len(cached.doc)
             
             # Format output
-            result = [f"PDF Structure: {pdf_path.name}"]
-            result.append(f"Total Pages: {len(doc)}")
+            result = [f"PDF Structure: {os.path.basename(pdf_path)}"]
+            result.append(f"Total Pages: {page_count}")
             
             if toc:
-                result.append("\\nTable of Contents:")
+                result.append("\nTable of Contents:")
                 for level, title, page in toc:
                     indent = "  " * (level - 1)
                     result.append(f"{indent}• {title} (Page {page})")
             
             if page_summaries:
-                result.append("\\nPage Summaries:")
+                result.append("\nPage Summaries:")
                 result.extend(page_summaries)
             
-            return "\\n".join(result)
+            return "\n".join(result)
             
         except Exception as e:
             return f"Error reading PDF structure: {str(e)}"
@@ -265,81 +399,314 @@ class PDFNavigator:
         Returns:
             PDF information
         """
-        pdf_path = Path(file_path)
-        if not pdf_path.exists():
-            return f"Error: PDF file not found: {file_path}"
+        try:
+            pdf_path = self._validated_path(file_path)
+        except PDFPathError as e:
+            return f"Error: {e}"
         
         try:
-            doc = fitz.open(str(pdf_path))
-            metadata = doc.metadata
-            
-            info = {
-                'filename': pdf_path.name,
-                'pages': len(doc),
-                'title': metadata.get('title', 'Unknown'),
-                'author': metadata.get('author', 'Unknown'),
-                'subject': metadata.get('subject', 'Unknown'),
-                'creator': metadata.get('creator', 'Unknown'),
-                'producer': metadata.get('producer', 'Unknown'),
-                'creation_date': metadata.get('creationDate', 'Unknown'),
-                'modification_date': metadata.get('modDate', 'Unknown'),
-            }
-            
-            doc.close()
-            
-            lines = [f"PDF Information: {info['filename']}"]
-            lines.append(f"Pages: {info['pages']}")
-            if info['title'] != 'Unknown':
-                lines.append(f"Title: {info['title']}")
-            if info['author'] != 'Unknown':
-                lines.append(f"Author: {info['author']}")
-            if info['subject'] != 'Unknown':
-                lines.append(f"Subject: {info['subject']}")
-            
-            return "\\n".join(lines)
+            with self._lock:
+                cached = self._get_cached_document(pdf_path)
+                if cached.info is None:
+                    metadata = cached.doc.metadata
+                    lines = [f"Pages: {len(cached.doc)}"]
+                    for key, label in (('title', 'Title'), ('author', 'Author'), ('subject', 'Subject')):
+                        value = metadata.get(key, 'Unknown')
+                        if value != 'Unknown':
+                            lines.append(f"{label}: {value}")
+                    cached.info = "\n".join(lines)
+                info = cached.info
+            
+            # The file name is as the caller gave it, so it is not cached
+            return f"PDF Information: {os.path.basename(pdf_path)}\n{info}"
             
         except Exception as e:
             return f"Error reading PDF info: {str(e)}"
     
-    def _open_with_skim(self, pdf_path: Path, page_number: int) -> None:
+    def _search_pdf_structured(self, pdf_path: str, query: str) -> List[Dict]:
+        """Find occurrences of query in PDF.
+        
+        Args:
+            pdf_path: Path to PDF file
+            query: Search query
+            
+        Returns:
+            Matches in page order, each with its 1-indexed 'page', whitespace-
+            normalized 'context' and character 'position' within the page.
+            Repeated searches return the same list, so it must not be modified.
+        """
+        if not query:
+            return []
+        
+        results = []
+        context_chars = self.config.search_context_chars
+        max_results = self.config.max_search_results
+        query_lower = query.lower()
+        pattern = None
+        
+        with self._lock:
+            cached = self._get_cached_document(pdf_path)
+            
+            # Results depend on the document version and the search settings
+            search_key = (cached.key, query, max_results, context_chars)
+            if search_key in self._search_results:
+                self._search_results.move_to_end(search_key)
+                return self._search_results[search_key]
+            
+            for page_num in range(len(cached.doc)):
+                # Stop before touching further pages once we have enough results
+                if len(results) >= max_results:
+                    break
+                
+                entry = self._lookup_page_text(cached.key, page_num)
+                if entry is None:
+                    # Extract and cache the page even without a hit. MuPDF's
+                    # own search_for builds the same text page, so screening
+                    # with it costs as much and leaves nothing for later queries.
+                    text, lower = cached.doc[page_num].get_text(), None
+                else:
+                    text, lower = entry
+                
+                # Find all occurrences of query (case-insensitive). A plain
+                # find on the cached lowercased page is several times faster
+                # than an IGNORECASE regex, and is reused by later queries.
+                if lower is None:
+                    lower = text.lower()
+                    self._store_page_text(cached.key, page_num, text, lower)
+                if len(lower) == len(text):
+                    positions = _find_all(lower, query_lower)
+                else:
+                    # Lowercasing changed the length (e.g. 'İ'), so offsets
+                    # in the copy do not line up with the original text
+                    if pattern is None:
+                        pattern = re.compile(re.escape(query), re.IGNORECASE)
+                    positions = (match.start() for match in pattern.finditer(text))
+                
+                # Limit results per page, and in total
+                for pos in islice(positions, min(3, max_results - len(results))):
+                    results.append({
+                        'page': page_num + 1,  # 1-indexed
+                        'context': self._match_context(text, pos, len(query), context_chars),
+                        'position': pos
+                    })
+            
+            self._search_results[search_key] = results
+            if len(self._search_results) > SEARCH_CACHE_SIZE:
+                self._search_results.popitem(last=False)
+        
+        return results
+    
+    def _validated_path(self, file_path: str, require_pdf: bool = False) -> str:
+        """Check that a tool's file argument names an existing file.
+        
+        Args:
+            file_path: Path to PDF file, as given to the tool
+            require_pdf: Also require a .pdf extension
+            
+        Returns:
+            The path, whose stat result is now cached for _cache_key
+            
+        Raises:
+            PDFPathError: If the file does not exist or is not a PDF
+        """
+        try:
+            self._stat(file_path)
+        except OSError:
+            raise PDFPathError(f"PDF file not found: {file_path}") from None
+        
+        if require_pdf and not file_path.lower().endswith('.pdf'):
+            raise PDFPathError(f"File is not a PDF: {file_path}")
+        
+        return file_path
+    
+    def _stat(self, pdf_path: str) -> Tuple[str, os.stat_result]:
+        """Get a file's resolved path and stat result, reusing recent ones.
+        
+        A tool call checks its file more than once, and calls tend to come in
+        bursts on the same paper, so results are reused for STAT_CACHE_TTL
+        seconds rather than going back to the filesystem each time.
+        
+        Args:
+            pdf_path: Path to PDF file
+            
+        Returns:
+            Resolved path and stat result
+            
+        Raises:
+            OSError: If the file cannot be stat'ed
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._stat_cache.get(pdf_path)
+            if entry is not None and now - entry[0] < STAT_CACHE_TTL:
+                return entry[1], entry[2]
+            
+            stat = os.stat(pdf_path)
+            resolved = os.path.realpath(pdf_path)
+            
+            # Forget expired entries so paths seen once do not accumulate
+            self._stat_cache = {k: v for k, v in self._stat_cache.items() if now - v[0] < STAT_CACHE_TTL}
+            self._stat_cache[pdf_path] = (now, resolved, stat)
+            return resolved, stat
+    
+    def _cache_key(self, pdf_path: str) -> Tuple[str, int, int]:
+        """Identify a PDF's current contents by resolved path, mtime and size."""
+        resolved, stat = self._stat(pdf_path)
+        return (resolved, stat.st_mtime_ns, stat.st_size)
+    
+    def _get_page_count(self, pdf_path: str) -> int:
+        """Get the number of pages in a PDF.
+        
+        Args:
+            pdf_path: Path to PDF file
+            
+        Returns:
+            Page count
+        """
+        return len(self._get_cached_document(pdf_path).doc)
+    
+    def _get_cached_document(self, pdf_path: str) -> _CachedDocument:
+        """Get the open document for a PDF.
+        
+        Entries are keyed on the resolved path plus modification time and size,
+        so a PDF that is rewritten on disk is reopened rather than served
+        stale. Evicted documents are closed, so callers must hold self._lock
+        while they use the returned entry.
+        
+        Args:
+            pdf_path: Path to PDF file
+            
+        Returns:
+            Cache entry for the PDF
+        """
+        key = self._cache_key(pdf_path)
+        with self._lock:
+            cached = self._doc_cache.get(key)
+            if cached is not None:
+                self._doc_cache.move_to_end(key)
+                return cached
+            
+            # Smaller PDFs are held in memory; larger ones are read from disk
+            in_memory = key[2] < self.config.inmem_threshold_bytes
+            cached = _CachedDocument(_open_pdf(pdf_path, in_memory), key)
+            
+            # Drop entries for older versions of this file, then bound the cache
+            evicted = [self._doc_cache.pop(k) for k in list(self._doc_cache) if k[0] == key[0]]
+            self._doc_cache[key] = cached
+            if len(self._doc_cache) > DOCUMENT_CACHE_SIZE:
+                evicted.append(self._doc_cache.popitem(last=False)[1])
+            for stale in evicted:
+                stale.doc.close()
+            
+            return cached
+    
+    def _lookup_page_text(self, key: Tuple[str, int, int], page_num: int) -> Optional[Tuple[str, Optional[str]]]:
+        """Get a page's cached text and lowercased text, marking it recently used.
+        
+        Args:
+            key: Cache key of the document
+            page_num: Page index (0-indexed)
+            
+        Returns:
+            The page's text and its lowercased copy (None until a search has
+            computed it), or None if the page is not cached
+        """
+        entry = self._page_text.get((key, page_num))
+        if entry is not None:
+            self._page_text.move_to_end((key, page_num))
+        return entry
+    
+    def _store_page_text(self, key: Tuple[str, int, int], page_num: int, text: str, lower: Optional[str] = None) -> None:
+        """Cache a page's text, evicting the least recently used pages.
+        
+        Args:
+            key: Cache key of the document
+            page_num: Page index (0-indexed)
+            text: Extracted text of the page
+            lower: Lowercased text, if already computed
+        """
+        self._page_text[(key, page_num)] = (text, lower)
+        self._page_text.move_to_end((key, page_num))
+        while len(self._page_text) > self.config.page_cache_size:
+            self._page_text.popitem(last=False)
+    
+    def _get_pages_text(self, pdf_path: str, start: int = 0, stop: Optional[int] = None) -> List[str]:
+        """Get the text of a range of pages, extracting only those not yet cached.
+        
+        Args:
+            pdf_path: Path to PDF file
+            start: First page (0-indexed)
+            stop: Page after the last one (0-indexed). If None, reads to end.
+            
+        Returns:
+            Text of each page in the range, in page order
+        """
+        with self._lock:
+            cached = self._get_cached_document(pdf_path)
+            if stop is None:
+                stop = len(cached.doc)
+            
+            pages = []
+            for page_num in range(start, stop):
+                entry = self._lookup_page_text(cached.key, page_num)
+                if entry is None:
+                    text = cached.doc[page_num].get_text()
+                    self._store_page_text(cached.key, page_num, text)
+                else:
+                    text = entry[0]
+                pages.append(text)
+            
+            return pages
+    
+    @staticmethod
+    def _match_context(text: str, pos: int, length: int, context_chars: int) -> str:
+        """Extract whitespace-normalized context around a match."""
+        context_start = max(0, pos - context_chars // 2)
+        context_end = min(len(text), pos + length + context_chars // 2)
+        context = text[context_start:context_end]
+        
+        # Clean up context (remove excessive whitespace)
+        return _WS_RE.sub(' ', context).strip()
+    
+    def _open_with_skim(self, pdf_path: str, page_number: int) -> None:
         """Open PDF with Skim (macOS)."""
-        abs_path = pdf_path.resolve()
+        abs_path = os.path.realpath(pdf_path)
         skim_url = f"skim://{abs_path}#page={page_number}"
         
         subprocess.run(["open", skim_url], check=True)
     
-    def _open_with_zathura(self, pdf_path: Path, page_number: int) -> None:
+    def _open_with_zathura(self, pdf_path: str, page_number: int) -> None:
         """Open PDF with Zathura (Linux)."""
-        cmd = ["zathura", "--page", str(page_number), str(pdf_path)]
+        cmd = ["zathura", "--page", str(page_number), pdf_path]
         if self.config.reader_path:
             cmd[0] = self.config.reader_path
-        subprocess.run(cmd, check=True)
+        self._start_detached(cmd)
     
-    def _open_with_evince(self, pdf_path: Path, page_number: int) -> None:
+    def _open_with_evince(self, pdf_path: str, page_number: int) -> None:
         """Open PDF with Evince (Linux)."""
-        cmd = ["evince", "--page-index", str(page_number - 1), str(pdf_path)]
+        cmd = ["evince", "--page-index", str(page_number - 1), pdf_path]
         if self.config.reader_path:
             cmd[0] = self.config.reader_path
-        subprocess.run(cmd, check=True)
+        self._start_detached(cmd)
     
-    def _open_with_sumatra(self, pdf_path: Path, page_number: int) -> None:
+    def _open_with_sumatra(self, pdf_path: str, page_number: int) -> None:
         """Open PDF with SumatraPDF (Windows)."""
-        cmd = ["SumatraPDF", "-page", str(page_number), str(pdf_path)]
+        cmd = ["SumatraPDF", "-page", str(page_number), pdf_path]
         if self.config.reader_path:
             cmd[0] = self.config.reader_path
-        subprocess.run(cmd, check=True)
+        self._start_detached(cmd)
     
-    def _open_with_acrobat(self, pdf_path: Path, page_number: int) -> None:
+    def _open_with_acrobat(self, pdf_path: str, page_number: int) -> None:
         """Open PDF with Adobe Acrobat."""
         if platform.system() == "Darwin":
             # macOS
-            cmd = ["open", "-a", "Adobe Acrobat Reader DC", str(pdf_path)]
+            cmd = ["open", "-a", "Adobe Acrobat Reader DC", pdf_path]
         elif platform.system() == "Windows":
             # Windows
-            cmd = ["AcroRd32.exe", f"/A page={page_number}", str(pdf_path)]
+            cmd = ["AcroRd32.exe", f"/A page={page_number}", pdf_path]
         else:
             # Linux
-            cmd = ["acroread", f"/A page={page_number}", str(pdf_path)]
+            cmd = ["acroread", f"/A page={page_number}", pdf_path]
         
         if self.config.reader_path:
             if platform.system() == "Darwin":
@@ -347,5 +714,25 @@ class PDFNavigator:
             else:
                 cmd[0] = self.config.reader_path
         
-        subprocess.run(cmd, check=True)
+        if platform.system() == "Darwin":
+            # `open` hands off to Launch Services and exits immediately
+            subprocess.run(cmd, check=True)
+        else:
+            self._start_detached(cmd)
+    
+    @staticmethod
+    def _start_detached(cmd: List[str]) -> None:
+        """Start a PDF reader process without waiting for it to exit.
+        
+        The reader runs in its own session with no access to our standard
+        streams, so it neither receives our signals nor reads from or writes
+        to the MCP stdio transport.
+        """
+        subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
 
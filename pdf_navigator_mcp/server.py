@@ -1,56 +1,29 @@
 """MCP server for PDF navigation."""
 
 import sys
-from typing import Optional, Union, List
+from typing import Optional, List
 from fastmcp import FastMCP
 from .pdf_navigator import PDFNavigator
-from .config import Config
-
-
-def safe_int(value: Union[int, str], param_name: str = "parameter") -> int:
-    """Safely convert a value to an integer with validation.
-    
-    Args:
-        value: The value to convert (int or str)
-        param_name: Name of the parameter for error messages
-        
-    Returns:
-        The integer value
-        
-    Raises:
-        ValueError: If the string cannot be converted to a valid integer
-    """
-    if isinstance(value, int):
-        return value
-    
-    if isinstance(value, str):
-        # Check if it's a valid integer string
-        value = value.strip()
-        if not value:
-            raise ValueError(f"{param_name} cannot be empty")
-        
-        # Check for valid integer format (optional minus sign + digits)
-        if not (value.isdigit() or (value.startswith('-') and value[1:].isdigit())):
-            raise ValueError(f"{param_name} must be a valid integer, got: '{value}'")
-        
-        try:
-            return int(value)
-        except ValueError:
-            raise ValueError(f"{param_name} must be a valid integer, got: '{value}'")
-    
-    raise ValueError(f"{param_name} must be an integer or string, got: {type(value)}")
+from .config import get_config
 
 
 # Initialize MCP server
 mcp = FastMCP("PDF Navigator")
 
-# Initialize PDF navigator
-config = Config()
-navigator = PDFNavigator(config)
+# PDF navigator, created on first tool call
+_navigator: Optional[PDFNavigator] = None
+
+
+def get_navigator() -> PDFNavigator:
+    """Get the shared PDF navigator, loading configuration on first use."""
+    global _navigator
+    if _navigator is None:
+        _navigator = PDFNavigator(get_config())
+    return _navigator
 
 
 @mcp.tool()
-def open_pdf_page(file_path: str, page_number: Union[int, str]) -> str:
+def open_pdf_page(file_path: str, page_number: int) -> str:
     """Open a PDF file to a specific page.
     
     Args:
@@ -60,10 +33,7 @@ def open_pdf_page(file_path: str, page_number: Union[int, str]) -> str:
     Returns:
         Status message indicating success or error
     """
-    # Convert string parameter to integer if needed
-    page_number = safe_int(page_number, "page_number")
-    
-    return navigator.open_pdf_page(file_path, page_number)
+    return get_navigator().open_pdf_page(file_path, page_number)
 
 
 @mcp.tool()
@@ -77,7 +47,21 @@ def search_pdf_text(file_path: str, query: str) -> str:
     Returns:
         Search results with page numbers and context
     """
-    return navigator.search_pdf_text(file_path, query)
+    return get_navigator().search_pdf_text(file_path, query)
+
+
+@mcp.tool()
+def search_many(file_path: str, queries: List[str]) -> str:
+    """Search for several terms in a PDF file at once.
+    
+    Args:
+        file_path: Path to the PDF file
+        queries: Texts to search for
+        
+    Returns:
+        Search results grouped by query, with page numbers and context
+    """
+    return get_navigator().search_many(file_path, queries)
 
 
 @mcp.tool()
@@ -90,11 +74,11 @@ def get_pdf_info(file_path: str) -> str:
     Returns:
         PDF information including title, author, page count, etc.
     """
-    return navigator.get_pdf_info(file_path)
+    return get_navigator().get_pdf_info(file_path)
 
 
 @mcp.tool()
-def read_pdf_text(file_path: str, start_page: Union[int, str] = 1, end_page: Optional[Union[int, str]] = None) -> str:
+def read_pdf_text(file_path: str, start_page: int = 1, end_page: Optional[int] = None) -> str:
     """Read text content from PDF pages.
     
     Args:
@@ -105,16 +89,11 @@ def read_pdf_text(file_path: str, start_page: Union[int, str] = 1, end_page: Opt
     Returns:
         Extracted text content with page markers
     """
-    # Convert string parameters to integers if needed
-    start_page = safe_int(start_page, "start_page")
-    if end_page is not None:
-        end_page = safe_int(end_page, "end_page")
-    
-    return navigator.read_pdf_text(file_path, start_page, end_page)
+    return get_navigator().read_pdf_text(file_path, start_page, end_page)
 
 
 @mcp.tool()
-def read_pdf_page(file_path: str, page_number: Union[int, str]) -> str:
+def read_pdf_page(file_path: str, page_number: int) -> str:
     """Read text content from a specific PDF page.
     
     Args:
@@ -124,10 +103,7 @@ def read_pdf_page(file_path: str, page_number: Union[int, str]) -> str:
     Returns:
         Text content of the specified page
     """
-    # Convert string parameter to integer if needed
-    page_number = safe_int(page_number, "page_number")
-    
-    return navigator.read_pdf_page(file_path, page_number)
+    return get_navigator().read_pdf_page(file_path, page_number)
 
 
 @mcp.tool()
@@ -140,11 +116,11 @@ def get_pdf_structure(file_path: str) -> str:
     Returns:
         PDF structure with TOC and page summaries
     """
-    return navigator.get_pdf_structure(file_path)
+    return get_navigator().get_pdf_structure(file_path)
 
 
 @mcp.tool()
-def search_and_open(file_path: str, query: str, result_index: Union[int, str] = 1) -> str:
+def search_and_open(file_path: str, query: str, result_index: int = 1) -> str:
     """Search for text in PDF and open to the specified result.
     
     Args:
@@ -155,34 +131,7 @@ def search_and_open(file_path: str, query: str, result_index: Union[int, str] =
     Returns:
         Status message indicating success or error
     """
-    # Convert string parameter to integer if needed
-    result_index = safe_int(result_index, "result_index")
-    # First search for the text
-    search_result = navigator.search_pdf_text(file_path, query)
-    
-    if "No results found" in search_result or "Error" in search_result:
-        return search_result
-    
-    # Parse search results to find the page for the specified result
-    lines = search_result.split('\\n')
-    result_lines = [line for line in lines if line.strip().startswith(f"{result_index}.")]
-    
-    if not result_lines:
-        return f"Result {result_index} not found. Check search results first."
-    
-    # Extract page number from result line
-    result_line = result_lines[0]
-    try:
-        # Format: "1. Page 5: ...context..."
-        page_part = result_line.split("Page ")[1].split(":")[0]
-        page_number = int(page_part)
-        
-        # Open PDF to that page
-        open_result = navigator.open_pdf_page(file_path, page_number)
-        
-        return f"Search result {result_index}: {open_result}"
-    except (IndexError, ValueError):
-        return f"Error parsing search result {result_index}"
+    return get_navigator().search_and_open(file_path, query, result_index)
 
 
 # Research Analysis Prompts
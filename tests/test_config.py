@@ -3,38 +3,37 @@
 import json
 import pytest
 from pathlib import Path
-from unittest.mock import Mock, patch, mock_open
-from pdf_navigator_mcp.config import Config
+from unittest.mock import patch, mock_open
+from pdf_navigator_mcp.config import Config, _get_config, get_config
 
 
 class TestConfig:
     """Test configuration management."""
     
-    def test_default_config(self):
+    def test_default_config(self, tmp_path):
         """Test default configuration values."""
-        with patch('pathlib.Path.exists', return_value=False):
-            with patch('builtins.open', mock_open()):
-                config = Config()
-                assert config.pdf_reader == "skim"
-                assert config.reader_path is None
-                assert config.search_context_chars == 100
-                assert config.max_search_results == 10
+        config = Config(tmp_path / "config.json")
+        assert config.pdf_reader == "skim"
+        assert config.reader_path is None
+        assert config.search_context_chars == 100
+        assert config.max_search_results == 10
+        assert config.page_cache_size == 512
+        assert config.inmem_threshold_bytes == 25_000_000
     
-    def test_load_existing_config(self):
+    def test_load_existing_config(self, tmp_path):
         """Test loading existing configuration file."""
-        mock_config = {
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps({
             "pdf_reader": "zathura",
             "reader_path": "/usr/bin/zathura",
             "search_context_chars": 150
-        }
+        }))
         
-        with patch('pathlib.Path.exists', return_value=True):
-            with patch('builtins.open', mock_open(read_data=json.dumps(mock_config))):
-                config = Config()
-                assert config.pdf_reader == "zathura"
-                assert config.reader_path == "/usr/bin/zathura"
-                assert config.search_context_chars == 150
-                assert config.max_search_results == 10  # Default value
+        config = Config(config_path)
+        assert config.pdf_reader == "zathura"
+        assert config.reader_path == "/usr/bin/zathura"
+        assert config.search_context_chars == 150
+        assert config.max_search_results == 10  # Default value
     
     def test_load_invalid_config(self):
         """Test loading invalid configuration file."""
@@ -44,41 +43,73 @@ class TestConfig:
                 # Should fall back to defaults
                 assert config.pdf_reader == "skim"
     
-    def test_get_set_config_value(self):
+    def test_get_set_config_value(self, tmp_path):
         """Test getting and setting configuration values."""
-        with patch('pathlib.Path.exists', return_value=False):
-            with patch('builtins.open', mock_open()):
-                config = Config()
-                
-                # Test get
-                assert config.get("pdf_reader") == "skim"
-                assert config.get("nonexistent", "default") == "default"
-                
-                # Test set
-                config.set("pdf_reader", "evince")
-                assert config.get("pdf_reader") == "evince"
+        config = Config(tmp_path / "config.json")
+        
+        # Test get
+        assert config.get("pdf_reader") == "skim"
+        assert config.get("nonexistent", "default") == "default"
+        
+        # Test set
+        config.set("pdf_reader", "evince")
+        assert config.get("pdf_reader") == "evince"
     
-    def test_save_config(self):
+    def test_save_config(self, tmp_path):
         """Test saving configuration to file."""
-        test_config = {"pdf_reader": "test"}
+        config_path = tmp_path / "config.json"
+        config = Config(config_path)
+        config.save_config({"pdf_reader": "test"})
         
-        with patch('pathlib.Path.exists', return_value=False):
-            mock_file = mock_open()
-            with patch('builtins.open', mock_file):
-                config = Config()
-                config.save_config(test_config)
-                
-                # Check that file was written
-                mock_file.assert_called()
-                handle = mock_file()
-                written_data = ''.join(call.args[0] for call in handle.write.call_args_list)
-                assert '"pdf_reader": "test"' in written_data
+        assert json.loads(config_path.read_text()) == {"pdf_reader": "test"}
     
     def test_custom_config_path(self):
         """Test using custom configuration path."""
         custom_path = Path("/tmp/custom-config.json")
+        config = Config(custom_path)
+        assert config.config_path == custom_path
+    
+    def test_config_loaded_lazily(self, tmp_path):
+        """Test that the config file is not read until a value is needed."""
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps({"pdf_reader": "skim"}))
+        config = Config(config_path)
+        
+        # Values come from the file as it is at first access
+        config_path.write_text(json.dumps({"pdf_reader": "evince"}))
+        assert config.pdf_reader == "evince"
+        assert config.max_search_results == 10
+    
+    def test_missing_config_not_written_until_set(self, tmp_path):
+        """Test that a missing config file is only created once a value is set."""
+        config_path = tmp_path / "config.json"
+        config = Config(config_path)
+        assert config.pdf_reader == "skim"
+        assert not config_path.exists()
         
-        with patch('pathlib.Path.exists', return_value=False):
-            with patch('builtins.open', mock_open()):
-                config = Config(custom_path)
-                assert config.config_path == custom_path
\ No newline at end of file
+        config.set("pdf_reader", "zathura")
+        assert json.loads(config_path.read_text())["pdf_reader"] == "zathura"
+    
+    def test_from_dict(self, tmp_path):
+        """Test creating a configuration from in-memory values."""
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps({"pdf_reader": "evince"}))
+        
+        config = Config.from_dict({"pdf_reader": "zathura"}, config_path)
+        assert config.pdf_reader == "zathura"
+        assert config.max_search_results == 10
+        assert config.config_path == config_path
+    
+    def test_get_config_shared(self, tmp_path):
+        """Test that get_config returns one Config per file, however it is named."""
+        _get_config.cache_clear()
+        custom_path = tmp_path / "custom-config.json"
+        default_path = Path.home() / ".pdf-navigator-config.json"
+        try:
+            assert get_config() is get_config(None) is get_config(default_path)
+            assert get_config(custom_path) is get_config(tmp_path / "." / "custom-config.json")
+            assert get_config(str(custom_path)) is get_config(custom_path)
+            assert get_config(custom_path) is not get_config()
+            assert get_config(custom_path).config_path == custom_path.resolve()
+        finally:
+            _get_config.cache_clear()
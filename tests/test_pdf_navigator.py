@@ -1,18 +1,47 @@
 """Tests for PDF Navigator functionality."""
 
+import time
 import pytest
-from pathlib import Path
+from contextlib import contextmanager
 from unittest.mock import Mock, patch
-from pdf_navigator_mcp.pdf_navigator import PDFNavigator
+from pdf_navigator_mcp.pdf_navigator import (
+    DOCUMENT_CACHE_SIZE,
+    STAT_CACHE_TTL,
+    PDFNavigator,
+)
 from pdf_navigator_mcp.config import Config
 
 
+def mock_document(*page_texts):
+    """Build a mock fitz.Document whose pages hold the given texts."""
+    pages = []
+    for text in page_texts:
+        page = Mock()
+        page.get_text.return_value = text
+        pages.append(page)
+    
+    doc = Mock()
+    doc.__len__ = Mock(return_value=len(pages))
+    doc.__getitem__ = Mock(side_effect=pages.__getitem__)
+    doc.mock_pages = pages
+    return doc
+
+
+@contextmanager
+def pdf_file_exists(mtime_ns=1, size=1024):
+    """Make any path look like an existing file with the given stat values."""
+    stat_result = Mock(st_mtime_ns=mtime_ns, st_size=size)
+    with patch('os.stat', return_value=stat_result):
+        yield
+
+
 class TestPDFNavigator:
     """Test PDF Navigator functionality."""
     
     def setup_method(self):
         """Set up test fixtures."""
-        self.config = Config()
+        # Mock documents stand in for files that do not exist, so open by path
+        self.config = Config.from_dict({"inmem_threshold_bytes": 0})
         self.navigator = PDFNavigator(self.config)
     
     def test_init_with_config(self):
@@ -37,6 +66,12 @@ class TestPDFNavigator:
         result = self.navigator.open_pdf_page("/path/to/file.txt", 1)
         assert "Error: PDF file not found" in result
     
+    def test_open_pdf_page_existing_file_not_pdf(self):
+        """Test opening an existing file without a .pdf extension."""
+        with pdf_file_exists():
+            result = self.navigator.open_pdf_page("/path/to/file.txt", 1)
+            assert "Error: File is not a PDF" in result
+    
     def test_search_pdf_text_file_not_found(self):
         """Test searching non-existent PDF file."""
         result = self.navigator.search_pdf_text("/nonexistent/file.pdf", "test")
@@ -48,7 +83,7 @@ class TestPDFNavigator:
         assert "Error: PDF file not found" in result
     
     @patch('pdf_navigator_mcp.pdf_navigator.subprocess.run')
-    @patch('pdf_navigator_mcp.pdf_navigator.fitz.open')
+    @patch('fitz.open')
     def test_open_with_skim(self, mock_fitz, mock_subprocess):
         """Test opening PDF with Skim."""
         # Mock PDF document
@@ -57,46 +92,372 @@ class TestPDFNavigator:
         mock_fitz.return_value = mock_doc
         
         # Mock file existence
-        with patch('pathlib.Path.exists', return_value=True):
-            with patch('pathlib.Path.suffix', '.pdf'):
-                self.config.set('pdf_reader', 'skim')
-                result = self.navigator.open_pdf_page("/test/file.pdf", 5)
-                
-                mock_subprocess.assert_called_once()
-                assert "Opened file.pdf to page 5" in result
-    
-    @patch('pdf_navigator_mcp.pdf_navigator.fitz.open')
+        with pdf_file_exists():
+            self.config.config['pdf_reader'] = 'skim'
+            result = self.navigator.open_pdf_page("/test/file.pdf", 5)
+            
+            mock_subprocess.assert_called_once()
+            assert "Opened file.pdf to page 5" in result
+            mock_doc.close.assert_not_called()
+    
+    @patch('pdf_navigator_mcp.pdf_navigator.subprocess.Popen')
+    @patch('fitz.open')
+    def test_open_with_zathura(self, mock_fitz, mock_popen):
+        """Test that Zathura is launched without waiting for it to exit."""
+        mock_doc = Mock()
+        mock_doc.__len__ = Mock(return_value=10)
+        mock_fitz.return_value = mock_doc
+        self.config.config['pdf_reader'] = 'zathura'
+        
+        with pdf_file_exists():
+            result = self.navigator.open_pdf_page("/test/file.pdf", 5)
+            assert "Opened file.pdf to page 5" in result
+        
+        mock_popen.assert_called_once()
+        assert mock_popen.call_args.args[0] == ["zathura", "--page", "5", "/test/file.pdf"]
+        assert mock_popen.call_args.kwargs['start_new_session'] is True
+    
+    @patch('fitz.open')
+    def test_open_pdf_page_out_of_range(self, mock_fitz):
+        """Test opening a page beyond the end of the document."""
+        mock_doc = Mock()
+        mock_doc.__len__ = Mock(return_value=10)
+        mock_fitz.return_value = mock_doc
+        
+        with pdf_file_exists():
+            result = self.navigator.open_pdf_page("/test/file.pdf", 11)
+            assert "Error: Page 11 out of range (1-10)" in result
+            mock_doc.close.assert_not_called()
+    
+    @patch('pdf_navigator_mcp.pdf_navigator.subprocess.run')
+    @patch('fitz.open')
+    def test_open_pdf_page_reuses_cached_page_count(self, mock_fitz, mock_subprocess):
+        """Test that opening a page of an already-read PDF does not reopen it."""
+        mock_doc = mock_document(*["Page content"] * 2)
+        mock_fitz.return_value = mock_doc
+        
+        with pdf_file_exists():
+            self.config.config['pdf_reader'] = 'skim'
+            self.navigator.read_pdf_text("/test/file.pdf")
+            opens = mock_fitz.call_count
+            result = self.navigator.open_pdf_page("/test/file.pdf", 2)
+            assert "Opened file.pdf to page 2" in result
+        
+        assert mock_fitz.call_count == opens
+    
+    @patch('fitz.open')
     def test_search_pdf_text_no_results(self, mock_fitz):
         """Test searching PDF with no results."""
         # Mock PDF document
-        mock_doc = Mock()
-        mock_doc.__len__ = Mock(return_value=1)
-        mock_page = Mock()
-        mock_page.get_text.return_value = "This is some text without the query"
-        mock_doc.__getitem__ = Mock(return_value=mock_page)
+        mock_doc = mock_document("This is some text without the query")
         mock_fitz.return_value = mock_doc
         
-        with patch('pathlib.Path.exists', return_value=True):
+        with pdf_file_exists():
             result = self.navigator.search_pdf_text("/test/file.pdf", "missing")
             assert "No results found" in result
     
-    @patch('pdf_navigator_mcp.pdf_navigator.fitz.open')
+    @patch('fitz.open')
     def test_search_pdf_text_with_results(self, mock_fitz):
         """Test searching PDF with results."""
         # Mock PDF document
-        mock_doc = Mock()
-        mock_doc.__len__ = Mock(return_value=1)
-        mock_page = Mock()
-        mock_page.get_text.return_value = "This is some text with the query term in it"
-        mock_doc.__getitem__ = Mock(return_value=mock_page)
+        mock_doc = mock_document("This is some text with the query term in it")
         mock_fitz.return_value = mock_doc
         
-        with patch('pathlib.Path.exists', return_value=True):
+        with pdf_file_exists():
             result = self.navigator.search_pdf_text("/test/file.pdf", "query")
             assert "Found 1 results" in result
             assert "Page 1:" in result
+            assert "\\n" not in result
+            assert result.splitlines()[2].startswith("1. Page 1: ")
+    
+    @patch('fitz.open')
+    def test_search_pdf_text_case_insensitive(self, mock_fitz):
+        """Test that search matches regardless of case and treats query literally."""
+        mock_doc = mock_document("See Eq. (1.2) and EQ. (1.2) again")
+        mock_fitz.return_value = mock_doc
+        
+        with pdf_file_exists():
+            result = self.navigator.search_pdf_text("/test/file.pdf", "eq. (1.2)")
+            assert "Found 2 results" in result
+    
+    @patch('fitz.open')
+    def test_search_pdf_text_per_page_limit(self, mock_fitz):
+        """Test that each page contributes at most 3 non-overlapping results."""
+        mock_doc = mock_document("tree " * 50, "aaaa")
+        mock_fitz.return_value = mock_doc
+        
+        with pdf_file_exists():
+            result = self.navigator.search_pdf_text("/test/file.pdf", "tree")
+            assert "Found 3 results" in result
+            assert "4. Page" not in result
+            
+            result = self.navigator.search_pdf_text("/test/file.pdf", "aa")
+            assert "Found 2 results" in result
+            assert "2. Page 2:" in result
+    
+    @patch('fitz.open')
+    def test_search_positions_when_lowercase_changes_length(self, mock_fitz):
+        """Test that match offsets stay correct when lowercasing grows the text."""
+        text = "İzmir and Tree then TREE"
+        mock_doc = mock_document(text)
+        mock_fitz.return_value = mock_doc
+        
+        with pdf_file_exists():
+            results = self.navigator._search_pdf_structured("/test/file.pdf", "tree")
+            assert [r['position'] for r in results] == [text.index("Tree"), text.index("TREE")]
+    
+    def test_search_pdf_text_non_ascii_case(self, tmp_path):
+        """Test that a query differing from the text in non-ASCII case still matches."""
+        import fitz
+        
+        pdf_path = tmp_path / "paper.pdf"
+        doc = fitz.open()
+        doc.new_page().insert_text((72, 72), "Über den Wolken")
+        doc.new_page().insert_text((72, 72), "Nothing to see")
+        doc.save(str(pdf_path))
+        doc.close()
+        
+        result = self.navigator.search_pdf_text(str(pdf_path), "über")
+        assert "Found 1 results" in result
+        assert "1. Page 1:" in result
+    
+    @patch('fitz.open')
+    def test_search_pdf_text_collapses_whitespace(self, mock_fitz):
+        """Test that search context has runs of whitespace collapsed."""
+        mock_doc = mock_document("  the query\n\n   spans\tlines  ")
+        mock_fitz.return_value = mock_doc
+        
+        with pdf_file_exists():
+            result = self.navigator.search_pdf_text("/test/file.pdf", "query")
+            assert "...the query spans lines..." in result
+    
+    @patch('fitz.open')
+    def test_page_text_cached_across_calls(self, mock_fitz):
+        """Test that repeated tool calls on an unchanged PDF reuse extracted text."""
+        mock_doc = mock_document(*["Cached page with the query"] * 2)
+        mock_fitz.return_value = mock_doc
+        
+        with pdf_file_exists():
+            self.navigator.search_pdf_text("/test/file.pdf", "query")
+            opens = mock_fitz.call_count
+            self.navigator.search_pdf_text("/test/file.pdf", "cached")
+            result = self.navigator.read_pdf_text("/test/file.pdf", 1, 2)
+            assert "--- Page 2 ---" in result
+        
+        assert mock_fitz.call_count == opens
+        for mock_page in mock_doc.mock_pages:
+            mock_page.get_text.assert_called_once()
+    
+    @patch('fitz.open')
+    def test_search_pdf_text_extracts_only_needed_pages(self, mock_fitz):
+        """Test that search stops extracting pages once it has enough results."""
+        mock_doc = mock_document("No match here", "The query", "Another query")
+        mock_fitz.return_value = mock_doc
+        self.config.config['max_search_results'] = 1
+        
+        with pdf_file_exists():
+            result = self.navigator.search_pdf_text("/test/file.pdf", "query")
+            assert "Found 1 results" in result
+            assert "1. Page 2:" in result
+        
+        missed, matched, unvisited = mock_doc.mock_pages
+        missed.get_text.assert_called_once()
+        matched.get_text.assert_called_once()
+        unvisited.get_text.assert_not_called()
+        
+        # Pages without a hit were cached too, so a new query reuses them
+        with pdf_file_exists():
+            self.navigator.search_pdf_text("/test/file.pdf", "another")
+        missed.get_text.assert_called_once()
+        unvisited.get_text.assert_called_once()
     
-    @patch('pdf_navigator_mcp.pdf_navigator.fitz.open')
+    @patch('fitz.open')
+    def test_search_pdf_text_stops_at_max_results(self, mock_fitz):
+        """Test that a page with several hits does not overshoot max_search_results."""
+        mock_doc = mock_document("query " * 5, "query again")
+        mock_fitz.return_value = mock_doc
+        self.config.config['max_search_results'] = 2
+        
+        with pdf_file_exists():
+            results = self.navigator._search_pdf_structured("/test/file.pdf", "query")
+            assert [r['page'] for r in results] == [1, 1]
+        
+        mock_doc.mock_pages[1].get_text.assert_not_called()
+    
+    @patch('fitz.open')
+    def test_read_pdf_page_extracts_only_that_page(self, mock_fitz):
+        """Test that reading one page does not extract the rest of the document."""
+        mock_doc = mock_document("First", "Second", "Third")
+        mock_fitz.return_value = mock_doc
+        
+        with pdf_file_exists():
+            result = self.navigator.read_pdf_page("/test/file.pdf", 2)
+            assert "--- Page 2 ---" in result
+        
+        first, second, third = mock_doc.mock_pages
+        first.get_text.assert_not_called()
+        second.get_text.assert_called_once()
+        third.get_text.assert_not_called()
+    
+    @patch('fitz.open')
+    def test_page_text_cache_invalidated_on_change(self, mock_fitz):
+        """Test that a modified PDF is reopened and the old document closed."""
+        old_doc = mock_document("Old text")
+        new_doc = mock_document("New text")
+        mock_fitz.side_effect = [old_doc, new_doc]
+        
+        with pdf_file_exists(mtime_ns=1):
+            assert "Old text" in self.navigator.read_pdf_page("/test/file.pdf", 1)
+        
+        with pdf_file_exists(mtime_ns=2):
+            # The change is only seen once the previous stat result expires
+            assert "Old text" in self.navigator.read_pdf_page("/test/file.pdf", 1)
+            with patch('time.monotonic', return_value=time.monotonic() + STAT_CACHE_TTL):
+                assert "New text" in self.navigator.read_pdf_page("/test/file.pdf", 1)
+        
+        assert len(self.navigator._doc_cache) == 1
+        old_doc.close.assert_called_once()
+        new_doc.close.assert_not_called()
+    
+    @patch('fitz.open')
+    def test_document_cache_closes_evicted(self, mock_fitz):
+        """Test that the least recently used document is closed when evicted."""
+        docs = [mock_document(f"Text {i}") for i in range(DOCUMENT_CACHE_SIZE + 1)]
+        mock_fitz.side_effect = docs
+        
+        with pdf_file_exists():
+            for i in range(DOCUMENT_CACHE_SIZE + 1):
+                self.navigator.read_pdf_page(f"/test/file{i}.pdf", 1)
+        
+        assert len(self.navigator._doc_cache) == DOCUMENT_CACHE_SIZE
+        docs[0].close.assert_called_once()
+        for doc in docs[1:]:
+            doc.close.assert_not_called()
+    
+    @patch('fitz.open')
+    def test_page_text_cache_bounded(self, mock_fitz):
+        """Test that only the configured number of pages of text are cached."""
+        mock_doc = mock_document("Page one", "Page two", "Page three")
+        mock_fitz.return_value = mock_doc
+        self.config.config['page_cache_size'] = 2
+        
+        with pdf_file_exists():
+            self.navigator.read_pdf_text("/test/file.pdf")
+            assert len(self.navigator._page_text) == 2
+            
+            # Pages 2 and 3 are still cached, page 1 was evicted
+            self.navigator.read_pdf_text("/test/file.pdf", 2, 3)
+            self.navigator.read_pdf_page("/test/file.pdf", 1)
+        
+        assert [p.get_text.call_count for p in mock_doc.mock_pages] == [2, 1, 1]
+    
+    @patch('fitz.open')
+    def test_page_text_outlives_closed_document(self, mock_fitz):
+        """Test that cached page text is reused after its document is evicted."""
+        docs = [mock_document(f"Text {i}") for i in range(DOCUMENT_CACHE_SIZE + 2)]
+        mock_fitz.side_effect = docs
+        
+        with pdf_file_exists():
+            for i in range(DOCUMENT_CACHE_SIZE + 1):
+                self.navigator.read_pdf_page(f"/test/file{i}.pdf", 1)
+            result = self.navigator.read_pdf_page("/test/file0.pdf", 1)
+        
+        assert "Text 0" in result
+        docs[0].close.assert_called_once()
+        docs[0].mock_pages[0].get_text.assert_called_once()
+    
+    @patch('pdf_navigator_mcp.pdf_navigator.subprocess.run')
+    @patch('fitz.open')
+    def test_search_and_open(self, mock_fitz, mock_subprocess):
+        """Test opening the page of a chosen search result."""
+        mock_doc = mock_document("Nothing here", "First query hit", "Second query hit")
+        mock_fitz.return_value = mock_doc
+        
+        with pdf_file_exists():
+            self.config.config['pdf_reader'] = 'skim'
+            result = self.navigator.search_and_open("/test/file.pdf", "query", 2)
+            assert "Search result 2: Opened file.pdf to page 3" in result
+            assert "#page=3" in mock_subprocess.call_args.args[0][1]
+            mock_fitz.assert_called_once()
+            mock_doc.close.assert_not_called()
+            
+            result = self.navigator.search_and_open("/test/file.pdf", "query", 3)
+            assert "Result 3 not found" in result
+            
+            result = self.navigator.search_and_open("/test/file.pdf", "missing")
+            assert "No results found" in result
+    
+    @patch('pdf_navigator_mcp.pdf_navigator.subprocess.run')
+    @patch('fitz.open')
+    def test_search_and_open_reuses_search_results(self, mock_fitz, mock_subprocess):
+        """Test that opening a result of a search just shown does not search again."""
+        mock_doc = mock_document("Nothing here", "A query hit")
+        mock_fitz.return_value = mock_doc
+        self.config.config['pdf_reader'] = 'skim'
+        
+        with pdf_file_exists():
+            self.navigator.search_pdf_text("/test/file.pdf", "query")
+            result = self.navigator.search_and_open("/test/file.pdf", "query", 1)
+            assert "Search result 1: Opened file.pdf to page 2" in result
+        
+        mock_doc.mock_pages[0].get_text.assert_called_once()
+        mock_doc.mock_pages[1].get_text.assert_called_once()
+    
+    def test_small_pdf_read_into_memory(self, tmp_path):
+        """Test that a small PDF is parsed from memory, unaffected by later writes."""
+        import fitz
+        
+        pdf_path = tmp_path / "paper.pdf"
+        doc = fitz.open()
+        for page_num in range(2):
+            doc.new_page().insert_text((72, 72), f"Text of page {page_num + 1}")
+        doc.save(str(pdf_path))
+        doc.close()
+        
+        self.config.config['inmem_threshold_bytes'] = 25_000_000
+        assert "Text of page 1" in self.navigator.read_pdf_page(str(pdf_path), 1)
+        
+        # Clobber the file in place; the open document still has its own copy
+        pdf_path.write_bytes(b"\0" * pdf_path.stat().st_size)
+        assert "Text of page 2" in self.navigator.read_pdf_page(str(pdf_path), 2)
+    
+    @patch('fitz.open')
+    def test_search_many(self, mock_fitz):
+        """Test searching several queries in one pass."""
+        mock_doc = mock_document("Phylogenetic trees and tree topology priors")
+        mock_fitz.return_value = mock_doc
+        
+        with pdf_file_exists():
+            result = self.navigator.search_many(
+                "/test/file.pdf", ["tree", "TREE TOPOLOGY", "missing"]
+            )
+            assert "Found 3 results for 3 queries" in result
+            assert "'tree' (2 results):" in result
+            assert "'TREE TOPOLOGY' (1 results):" in result
+            assert "'missing': no results" in result
+            mock_doc.mock_pages[0].get_text.assert_called_once()
+    
+    @patch('fitz.open')
+    def test_search_many_overlapping_queries(self, mock_fitz):
+        """Test that a query inside another still matches, and case duplicates are merged."""
+        mock_fitz.return_value = mock_document("Advances in machine learning")
+        
+        with pdf_file_exists():
+            result = self.navigator.search_many(
+                "/test/file.pdf", ["machine learning", "learning", "Learning"]
+            )
+            assert "Found 2 results for 2 queries" in result
+            assert "'machine learning' (1 results):" in result
+            assert "'learning' (1 results):" in result
+            assert "'Learning'" not in result
+    
+    def test_search_many_no_queries(self):
+        """Test searching with an empty query list."""
+        with pdf_file_exists():
+            result = self.navigator.search_many("/test/file.pdf", ["", ""])
+            assert "Error: No search queries given" in result
+    
+    @patch('fitz.open')
     def test_get_pdf_info(self, mock_fitz):
         """Test getting PDF metadata."""
         # Mock PDF document
@@ -109,89 +470,101 @@ class TestPDFNavigator:
         }
         mock_fitz.return_value = mock_doc
         
-        with patch('pathlib.Path.exists', return_value=True):
+        with pdf_file_exists():
             result = self.navigator.get_pdf_info("/test/file.pdf")
             assert "Pages: 5" in result
             assert "Title: Test Document" in result
             assert "Author: Test Author" in result
+            assert result.splitlines() == [
+                "PDF Information: file.pdf",
+                "Pages: 5",
+                "Title: Test Document",
+                "Author: Test Author",
+                "Subject: Test Subject",
+            ]
+            
+            # The formatted details are kept with the open document
+            mock_doc.metadata = {}
+            assert self.navigator.get_pdf_info("/test/file.pdf") == result
     
-    @patch('pdf_navigator_mcp.pdf_navigator.fitz.open')
+    @patch('fitz.open')
     def test_read_pdf_text(self, mock_fitz):
         """Test reading PDF text from page range."""
         # Mock PDF document
-        mock_doc = Mock()
-        mock_doc.__len__ = Mock(return_value=5)
-        mock_page = Mock()
-        mock_page.get_text.return_value = "This is page content"
-        mock_doc.__getitem__ = Mock(return_value=mock_page)
+        mock_doc = mock_document(*["This is page content"] * 5)
         mock_fitz.return_value = mock_doc
         
-        with patch('pathlib.Path.exists', return_value=True):
+        with pdf_file_exists():
             result = self.navigator.read_pdf_text("/test/file.pdf", 1, 2)
             assert "--- Page 1 ---" in result
             assert "--- Page 2 ---" in result
             assert "This is page content" in result
     
-    @patch('pdf_navigator_mcp.pdf_navigator.fitz.open')
+    @patch('fitz.open')
+    def test_read_pdf_text_skips_blank_pages(self, mock_fitz):
+        """Test the page layout of read text, leaving out whitespace-only pages."""
+        mock_doc = mock_document("First page\n", " \n\n", "Third page\n")
+        mock_fitz.return_value = mock_doc
+        
+        with pdf_file_exists():
+            result = self.navigator.read_pdf_text("/test/file.pdf")
+            assert result == "--- Page 1 ---\nFirst page\n\n\n--- Page 3 ---\nThird page\n"
+    
+    @patch('fitz.open')
     def test_read_pdf_page(self, mock_fitz):
         """Test reading single PDF page."""
         # Mock PDF document
-        mock_doc = Mock()
-        mock_doc.__len__ = Mock(return_value=5)
-        mock_page = Mock()
-        mock_page.get_text.return_value = "Single page content"
-        mock_doc.__getitem__ = Mock(return_value=mock_page)
+        mock_doc = mock_document(*["Single page content"] * 5)
         mock_fitz.return_value = mock_doc
         
-        with patch('pathlib.Path.exists', return_value=True):
+        with pdf_file_exists():
             result = self.navigator.read_pdf_page("/test/file.pdf", 3)
             assert "--- Page 3 ---" in result
             assert "Single page content" in result
     
-    @patch('pdf_navigator_mcp.pdf_navigator.fitz.open')
+    @patch('fitz.open')
     def test_get_pdf_structure(self, mock_fitz):
         """Test getting PDF structure."""
-        # Mock PDF document
-        mock_doc = Mock()
-        mock_doc.__len__ = Mock(return_value=3)
+        # Mock PDF document with pages
+        mock_doc = mock_document(
+            "\n  Introduction section\n\nThis is the intro\n",
+            "Methods section\nOur methodology",
+            "Results section\nOur findings",
+        )
         mock_doc.get_toc.return_value = [
             [1, "Introduction", 1],
             [1, "Methods", 2],
             [1, "Results", 3]
         ]
-        
-        # Mock pages
-        mock_page1 = Mock()
-        mock_page1.get_text.return_value = "Introduction section\nThis is the intro"
-        mock_page2 = Mock()
-        mock_page2.get_text.return_value = "Methods section\nOur methodology"
-        mock_page3 = Mock()
-        mock_page3.get_text.return_value = "Results section\nOur findings"
-        
-        mock_doc.__getitem__ = Mock(side_effect=[mock_page1, mock_page2, mock_page3])
         mock_fitz.return_value = mock_doc
         
-        with patch('pathlib.Path.exists', return_value=True):
+        with pdf_file_exists():
             result = self.navigator.get_pdf_structure("/test/file.pdf")
             assert "Table of Contents:" in result
             assert "Introduction (Page 1)" in result
             assert "Methods (Page 2)" in result
             assert "Results (Page 3)" in result
             assert "Page Summaries:" in result
+            assert "Total Pages: 3" in result
+            assert "Page 1: Introduction section This is the intro..." in result
+            
+            # The TOC and summaries are worked out once per document
+            assert self.navigator.get_pdf_structure("/test/file.pdf") == result
+            mock_doc.get_toc.assert_called_once()
     
     def test_read_pdf_text_file_not_found(self):
         """Test reading text from non-existent file."""
         result = self.navigator.read_pdf_text("/nonexistent/file.pdf")
         assert "Error: PDF file not found" in result
     
-    @patch('pdf_navigator_mcp.pdf_navigator.fitz.open')
+    @patch('fitz.open')
     def test_read_pdf_text_invalid_page_range(self, mock_fitz):
         """Test reading with invalid page range."""
         mock_doc = Mock()
         mock_doc.__len__ = Mock(return_value=5)
         mock_fitz.return_value = mock_doc
         
-        with patch('pathlib.Path.exists', return_value=True):
+        with pdf_file_exists():
             result = self.navigator.read_pdf_text("/test/file.pdf", 10, 15)
             assert "Error: Start page 10 out of range" in result
 
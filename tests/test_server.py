@@ -0,0 +1,38 @@
+"""Tests for the MCP server tools."""
+
+import asyncio
+import pytest
+from unittest.mock import patch
+from fastmcp import Client
+from fastmcp.exceptions import ToolError
+from pdf_navigator_mcp.pdf_navigator import PDFNavigator
+from pdf_navigator_mcp.server import mcp
+
+
+def call_tool(name, arguments):
+    """Call a tool through an in-memory MCP client, as a real client would."""
+    async def call():
+        async with Client(mcp) as client:
+            return await client.call_tool(name, arguments)
+    return asyncio.run(call())
+
+
+class TestToolArguments:
+    """Test validation of integer tool arguments."""
+    
+    def test_string_integers_accepted(self):
+        """Test that integer strings, including surrounding whitespace, are converted."""
+        with patch.object(PDFNavigator, 'read_pdf_text', return_value="ok") as mock_read:
+            call_tool("read_pdf_text", {"file_path": "/test/file.pdf", "start_page": "2", "end_page": " 5 "})
+        
+        mock_read.assert_called_once_with("/test/file.pdf", 2, 5)
+    
+    def test_invalid_integers_rejected(self):
+        """Test that non-integer values are rejected with the parameter name."""
+        with patch.object(PDFNavigator, 'open_pdf_page') as mock_open:
+            with pytest.raises(ToolError, match="page_number"):
+                call_tool("open_pdf_page", {"file_path": "/test/file.pdf", "page_number": "five"})
+            with pytest.raises(ToolError, match="page_number"):
+                call_tool("open_pdf_page", {"file_path": "/test/file.pdf", "page_number": 2.5})
+        
+        mock_open.assert_not_called()